@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+import hashlib
+import re
+import warnings
+import weakref
+from copy import copy
+from dataclasses import dataclass, field, replace
 from io import BytesIO
 
+from lxml import etree
 from pptx import Presentation
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
@@ -16,15 +22,128 @@ from pptx.slide import Slide
 # skipped when generically copying part relationships.
 _STRUCTURAL_REL_TYPES = frozenset({RT.SLIDE_MASTER, RT.SLIDE_LAYOUT, RT.THEME})
 
-# Namespace URI used for r:embed / r:link / r:id attributes
+# Attribute under which the _CopyCtx for a target Presentation is stored
+# (see SlideCopier._target_ctx()).
+_TARGET_CTX_ATTR = "_slide_copier_ctx"
+
+# Key under which the deprecated ``cache=`` dict of copy_layouts() and
+# copy_slides() holds its _CopyCtx (see SlideCopier._cache_ctx()).
+_CACHE_CTX_KEY = "_slide_copier_ctx"
+
+# Namespace URIs
 _R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+# Clark-notation names used in hot loops
+_P_SP = f"{{{_P_NS}}}sp"
+_P_EXT_LST = f"{{{_P_NS}}}extLst"
+_R_EMBED = f"{{{_R_NS}}}embed"
+_R_LINK = f"{{{_R_NS}}}link"
+_R_ID = f"{{{_R_NS}}}id"
+_R_ATTRS = (_R_EMBED, _R_LINK, _R_ID)
+
+# Partname templates for content types whose parts PowerPoint always names
+# the same way, so the template need not be derived from the source partname.
+_CT_TO_TEMPLATE = {
+    CT.DML_CHART: "/ppt/charts/chart%d.xml",
+    CT.DML_DIAGRAM_COLORS: "/ppt/diagrams/colors%d.xml",
+    CT.DML_DIAGRAM_DATA: "/ppt/diagrams/data%d.xml",
+    CT.DML_DIAGRAM_DRAWING: "/ppt/diagrams/drawing%d.xml",
+    CT.DML_DIAGRAM_LAYOUT: "/ppt/diagrams/layout%d.xml",
+    CT.DML_DIAGRAM_STYLE: "/ppt/diagrams/quickStyle%d.xml",
+    CT.OFC_OLE_OBJECT: "/ppt/embeddings/oleObject%d.bin",
+    CT.PML_COMMENTS: "/ppt/comments/comment%d.xml",
+    CT.PML_NOTES_SLIDE: "/ppt/notesSlides/notesSlide%d.xml",
+    CT.PML_TAGS: "/ppt/tags/tag%d.xml",
+}
+
+# Trailing part number in a partname, e.g. the "3" in "/ppt/media/image3.png"
+_PARTNAME_RE = re.compile(r'\d+(?=\.[^.]+$)')
+
+# Elements (including the context element itself) that carry an r:embed,
+# r:link or r:id attribute.  ``descendant-or-self`` keeps the query scoped to
+# the given subtree; ``//`` would search the whole document.
+_RID_XPATH = etree.XPath(
+    "descendant-or-self::*[@r:embed or @r:link or @r:id]",
+    namespaces={"r": _R_NS},
+)
+
+
+def _fast_copy_element(element):
+    """Return a deep clone of an lxml element.
+
+    lxml implements ``__copy__`` as a C-level clone of the whole subtree and
+    ``__deepcopy__`` simply calls it, so ``copy()`` and ``deepcopy()`` are
+    equivalent here; this helper is just the single place to change the copy
+    strategy.  A ``tostring``/``fromstring`` round-trip was measured to be
+    ~3x slower on typical masters and layouts.  The clone keeps
+    python-pptx's custom element classes.
+    """
+    return copy(element)
+
+
+class _PartCache:
+    """Map source parts to values kept for a target presentation.
+
+    The values are the parts' copies in the target or, for images, the SHA-1
+    digests of their blobs.
+
+    Entries are grouped per source package in a ``WeakKeyDictionary``, so
+    the cache does not keep a source presentation alive: once the source is
+    garbage collected its entries are dropped.
+    """
+
+    def __init__(self):
+        self._by_package = weakref.WeakKeyDictionary()
+
+    def get(self, source_part):
+        """Return the value stored for source_part, or None if there is none."""
+        copies = self._by_package.get(source_part.package)
+        if copies is None:
+            return None
+        return copies.get(source_part.partname)
+
+    def __setitem__(self, source_part, value):
+        self._by_package.setdefault(source_part.package, {})[source_part.partname] = value
+
+
+@dataclass(frozen=True)
+class _CopyCtx:
+    """Parts already copied into one target presentation.
+
+    ``copy_layouts()`` and ``copy_slides()`` use a fresh context per call;
+    repeated ``copy_slide()`` calls share the one stored on the target (see
+    ``SlideCopier._target_ctx()``).
+
+    ``package`` is the target's OPC package.  ``masters``, ``layouts`` and
+    ``themes`` are ``_PartCache`` instances mapping a source part to its
+    copy in the target.  ``images`` maps the SHA-1 digest of an image blob
+    to the target ImagePart holding it, and ``image_digests`` maps a source
+    image part to that digest so each source image is hashed once.
+    ``theme_digests`` is the target's ``_theme_digests()`` map, filled on
+    first use (see ``SlideCopier._target_theme_digests()``) and extended as
+    masters are copied.
+    """
+
+    package: object
+    masters: _PartCache = field(default_factory=_PartCache)
+    layouts: _PartCache = field(default_factory=_PartCache)
+    themes: _PartCache = field(default_factory=_PartCache)
+    images: dict = field(default_factory=dict)
+    image_digests: _PartCache = field(default_factory=_PartCache)
+    theme_digests: dict = field(default_factory=dict)
 
 
 class SlideCopier:
     """Handles copying slides between presentations."""
 
     @staticmethod
-    def copy_layouts(source_prs: Presentation, target_prs: Presentation) -> dict:
+    def copy_layouts(
+        source_prs: Presentation,
+        target_prs: Presentation,
+        cache: dict | None = None,
+        _ctx: _CopyCtx | None = None,
+    ) -> dict:
         """Copy all masters/layouts/themes from source to target at once.
 
         Call this once before copying slides so that the target ends up
@@ -33,23 +152,37 @@ class SlideCopier:
         Args:
             source_prs: Source presentation
             target_prs: Target presentation
+            cache: Deprecated.  Optional dict passed to several calls that
+                   copy into the same target so that they share copied
+                   parts; edits made to source_prs between those calls are
+                   then not picked up.
+            _ctx: Optional _CopyCtx shared with the caller.  When *None* a
+                  fresh one is used for this call, so edits made to
+                  source_prs since an earlier call are picked up.
 
         Returns:
             layout_map: dict mapping {source layout name: target SlideLayout}
         """
-        cache: dict = {}
+        if _ctx is not None:
+            ctx = _ctx
+        elif cache is not None:
+            ctx = SlideCopier._cache_ctx(cache, target_prs)
+        else:
+            ctx = _CopyCtx(package=target_prs.part.package)
         layout_map: dict[str, object] = {}
+        target_digests = SlideCopier._target_theme_digests(target_prs, ctx)
 
         for source_master in source_prs.slide_masters:
             source_master_part = source_master.part
-            matching_target_master = SlideCopier._find_matching_master(
-                source_master_part, target_prs,
+            source_digest = SlideCopier._theme_digest(source_master_part)
+            matching_target_master = (
+                None if source_digest is None else target_digests.get(source_digest)
             )
 
             if matching_target_master is not None:
                 # Same theme — look up existing layouts by name, copy only missing ones
                 target_master_part = matching_target_master.part
-                cache[id(source_master_part)] = target_master_part
+                ctx.masters[source_master_part] = target_master_part
                 existing = {sl.name: sl for sl in matching_target_master.slide_layouts}
                 for layout in source_master.slide_layouts:
                     if layout.name in existing:
@@ -58,25 +191,23 @@ class SlideCopier:
                         # Layout not in target — copy it
                         source_layout_part = layout.part
                         target_layout_part = SlideCopier._copy_slide_layout_part(
-                            source_layout_part, target_prs, cache,
+                            source_layout_part, target_prs, ctx,
                         )
-                        cache[id(source_layout_part)] = target_layout_part
+                        ctx.layouts[source_layout_part] = target_layout_part
                         layout_map[layout.name] = target_layout_part.slide_layout
             else:
                 # Different theme — copy everything as before
                 target_master_part = SlideCopier._get_or_copy_slide_master(
-                    source_master_part, target_prs, cache,
+                    source_master_part, target_prs, ctx, source_digest,
                 )
                 for layout in source_master.slide_layouts:
                     source_layout_part = layout.part
-                    cache_key = id(source_layout_part)
-                    if cache_key not in cache:
+                    target_layout_part = ctx.layouts.get(source_layout_part)
+                    if target_layout_part is None:
                         target_layout_part = SlideCopier._copy_slide_layout_part(
-                            source_layout_part, target_prs, cache,
+                            source_layout_part, target_prs, ctx,
                         )
-                        cache[cache_key] = target_layout_part
-                    else:
-                        target_layout_part = cache[cache_key]
+                        ctx.layouts[source_layout_part] = target_layout_part
                     layout_map[layout.name] = target_layout_part.slide_layout
 
         return layout_map
@@ -87,12 +218,15 @@ class SlideCopier:
         target_prs: Presentation,
         slide_indices=None,
         target_slide_index: int | None = None,
+        cache: dict | None = None,
     ):
         """Copy multiple slides from source to target.
 
         Copies all source layouts/masters/themes once upfront via
         ``copy_layouts()``, then copies each slide referencing the
-        pre-copied layouts by name.
+        pre-copied layouts by name.  Copied parts are shared within this
+        call only, so edits made to source_prs since an earlier call are
+        picked up.
 
         Args:
             source_prs: Source presentation
@@ -103,6 +237,9 @@ class SlideCopier:
                            slides in the target presentation.  Slides are
                            inserted sequentially starting from this position.
                            If None, slides are appended at the end.
+            cache: Deprecated.  Optional dict shared by several calls that
+                           copy into the same target (see
+                           ``copy_layouts()``).
 
         Returns:
             List of newly created slides in target presentation
@@ -110,7 +247,18 @@ class SlideCopier:
         if slide_indices is None:
             slide_indices = list(range(len(source_prs.slides)))
 
-        layout_map = SlideCopier.copy_layouts(source_prs, target_prs)
+        if cache is not None:
+            ctx = SlideCopier._cache_ctx(cache, target_prs)
+        else:
+            ctx = _CopyCtx(package=target_prs.part.package)
+        layout_map = SlideCopier.copy_layouts(source_prs, target_prs, _ctx=ctx)
+        # Resolve each distinct source slide and its target layout once,
+        # even when an index is repeated in slide_indices.
+        source_slides = {idx: source_prs.slides[idx] for idx in slide_indices}
+        target_layouts = {
+            idx: layout_map[slide.slide_layout.name]
+            for idx, slide in source_slides.items()
+        }
         slides = []
         for i, idx in enumerate(slide_indices):
             insert_at = None
@@ -120,6 +268,8 @@ class SlideCopier:
                 source_prs, idx, target_prs,
                 _layout_map=layout_map,
                 target_slide_index=insert_at,
+                _target_layout=target_layouts[idx],
+                _ctx=ctx,
             )
             slides.append(slide)
         return slides
@@ -131,6 +281,8 @@ class SlideCopier:
         target_prs: Presentation,
         _layout_map: dict | None = None,
         target_slide_index: int | None = None,
+        _target_layout=None,
+        _ctx: _CopyCtx | None = None,
     ) -> Slide:
         """Copy a slide from source presentation to target presentation.
 
@@ -145,29 +297,39 @@ class SlideCopier:
             _layout_map: Optional {layout_name: SlideLayout} dict returned by
                          ``copy_layouts()``.  When provided the pre-copied
                          layout is looked up by name.  When *None* the layout
-                         is copied on demand (backward-compatible behaviour).
+                         is copied on demand (backward-compatible behaviour)
+                         and remembered on ``target_prs``, so later calls
+                         reuse it instead of copying it again.
             target_slide_index: Optional 0-based index at which to insert the
                          slide in the target presentation.  When *None* (the
                          default) the slide is appended at the end.
+            _target_layout: Optional target SlideLayout already resolved by
+                         the caller.  When provided it is used as is and
+                         ``_layout_map`` is not consulted.
+            _ctx: Optional _CopyCtx shared with the caller (``copy_slides()``).
+                         When *None* the context remembered on ``target_prs``
+                         is used (see ``invalidate_cache()``).
 
         Returns:
             The newly created slide in target presentation
         """
         source_slide = source_prs.slides[source_slide_index]
+        ctx = _ctx if _ctx is not None else SlideCopier._target_ctx(target_prs)
 
         # Copy slide size only when target has no existing slides
         if len(target_prs.slides) == 0:
             SlideCopier._copy_slide_size(source_prs, target_prs)
 
         # Resolve the target layout
-        if _layout_map is not None:
+        if _target_layout is not None:
+            target_layout = _target_layout
+        elif _layout_map is not None:
             source_layout_name = source_slide.slide_layout.name
             target_layout = _layout_map[source_layout_name]
         else:
             # Backward-compatible on-demand copy
-            cache: dict = {}
             target_layout_part = SlideCopier._get_or_copy_slide_layout(
-                source_slide, target_prs, cache,
+                source_slide, target_prs, ctx,
             )
             target_layout = target_layout_part.slide_layout
 
@@ -175,25 +337,25 @@ class SlideCopier:
         dest_slide = target_prs.slides.add_slide(target_layout)
 
         # Remove auto-generated placeholder shapes from the layout
-        # to avoid duplicates when we deepcopy the source shapes below.
+        # to avoid duplicates when we clone the source shapes below.
         spTree = dest_slide.shapes._spTree
-        for sp in list(spTree.iterchildren(
-            '{http://schemas.openxmlformats.org/presentationml/2006/main}sp',
-        )):
+        for sp in list(spTree.iterchildren(_P_SP)):
             spTree.remove(sp)
 
-        # Copy all shapes using deepcopy at XML level
-        for shape in source_slide.shapes:
-            try:
-                new_element = deepcopy(shape.element)
-                dest_slide.shapes._spTree.insert_element_before(new_element, "p:extLst")
-            except Exception:
-                continue
+        # Copy all shapes by cloning them at XML level.  Append them in one
+        # batch and then move p:extLst (which must stay last) back to the
+        # end, instead of searching for it once per shape.
+        new_elements = [_fast_copy_element(shape.element) for shape in source_slide.shapes]
+        ext_lst = spTree.find(_P_EXT_LST)
+        spTree.extend(new_elements)
+        if ext_lst is not None:
+            spTree.append(ext_lst)
 
         # Copy all non-structural relationships (images, charts, media, etc.)
         # and remap rIds in the copied XML so references stay valid.
         rid_mapping = SlideCopier._copy_part_rels(
-            source_slide.part, dest_slide.part, target_prs.part.package,
+            source_slide.part, dest_slide.part, ctx.package,
+            ctx.images, ctx.image_digests,
         )
         if rid_mapping:
             SlideCopier._remap_rids(dest_slide.shapes._spTree, rid_mapping)
@@ -204,59 +366,124 @@ class SlideCopier:
 
         return dest_slide
 
+    @staticmethod
+    def invalidate_cache(target_prs: Presentation):
+        """Forget the masters/layouts/themes/images copied into target_prs.
+
+        Repeated ``copy_slide()`` calls remember the parts they copy so that
+        later calls reuse them as is.  Call this after editing source
+        layouts, masters or themes that were already copied by
+        ``copy_slide()`` (otherwise the stale copies are reused), or after
+        removing copied masters or layouts from target_prs.
+        ``copy_layouts()`` and ``copy_slides()`` do not use this cache.
+        """
+        if hasattr(target_prs, _TARGET_CTX_ATTR):
+            delattr(target_prs, _TARGET_CTX_ATTR)
+
     # ------------------------------------------------------------------
     # Layout / Master / Theme copying
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _get_or_copy_slide_layout(source_slide, target_prs, cache):
+    def _target_ctx(target_prs):
+        """Return a _CopyCtx sharing the part caches stored on target_prs.
+
+        The caches are created on first use.  ``theme_digests`` is fresh for
+        every call, so masters added to or removed from the target between
+        calls are seen.
+        """
+        ctx = getattr(target_prs, _TARGET_CTX_ATTR, None)
+        if ctx is None:
+            ctx = _CopyCtx(package=target_prs.part.package)
+            setattr(target_prs, _TARGET_CTX_ATTR, ctx)
+        return replace(ctx, theme_digests={})
+
+    @staticmethod
+    def _cache_ctx(cache, target_prs):
+        """Return a _CopyCtx sharing the part caches kept in *cache*.
+
+        Backs the deprecated ``cache=`` argument of ``copy_layouts()`` and
+        ``copy_slides()``.  A dict first used with another target gets a
+        new context.  ``theme_digests`` is fresh for every call, as in
+        ``_target_ctx()``.
+        """
+        warnings.warn(
+            "the cache argument is deprecated; copy_layouts() and "
+            "copy_slides() share copied parts within one call",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        package = target_prs.part.package
+        ctx = cache.get(_CACHE_CTX_KEY)
+        if ctx is None or ctx.package is not package:
+            ctx = _CopyCtx(package=package)
+            cache[_CACHE_CTX_KEY] = ctx
+        return replace(ctx, theme_digests={})
+
+    @staticmethod
+    def _get_or_copy_slide_layout(source_slide, target_prs, ctx):
         """Return a SlideLayoutPart in target_prs that mirrors the source slide's layout.
 
-        If the layout was already copied (present in cache), the cached part
-        is returned.
+        If the layout was already copied (present in ctx.layouts), the cached
+        part is returned.
         """
         source_layout_part = source_slide.part.part_related_by(RT.SLIDE_LAYOUT)
-        cache_key = id(source_layout_part)
-        if cache_key in cache:
-            return cache[cache_key]
+        target_layout_part = ctx.layouts.get(source_layout_part)
+        if target_layout_part is not None:
+            return target_layout_part
 
         target_layout_part = SlideCopier._copy_slide_layout_part(
-            source_layout_part, target_prs, cache,
+            source_layout_part, target_prs, ctx,
         )
-        cache[cache_key] = target_layout_part
+        ctx.layouts[source_layout_part] = target_layout_part
         return target_layout_part
 
     @staticmethod
-    def _find_matching_master(source_master_part, target_prs):
-        """Find a target master whose theme blob matches the source master's."""
+    def _target_theme_digests(target_prs, ctx):
+        """Return ctx.theme_digests, hashing the target's themes on first use.
+
+        Masters copied later are added by ``_get_or_copy_slide_master()``, so
+        each target theme is hashed once per ctx.
+        """
+        if not ctx.theme_digests:
+            ctx.theme_digests.update(SlideCopier._theme_digests(target_prs))
+        return ctx.theme_digests
+
+    @staticmethod
+    def _theme_digests(prs):
+        """Return {theme SHA-1 digest: SlideMaster} for the masters of prs.
+
+        When several masters share a theme the first one wins.
+        """
+        digests = {}
+        for master in prs.slide_masters:
+            digest = SlideCopier._theme_digest(master.part)
+            if digest is not None:
+                digests.setdefault(digest, master)
+        return digests
+
+    @staticmethod
+    def _theme_digest(master_part):
+        """Return the SHA-1 digest of a master's theme blob, or None if it has no theme."""
         try:
-            source_theme_blob = source_master_part.part_related_by(RT.THEME).blob
+            theme_blob = master_part.part_related_by(RT.THEME).blob
         except KeyError:
             return None
-
-        for target_master in target_prs.slide_masters:
-            try:
-                target_theme_blob = target_master.part.part_related_by(RT.THEME).blob
-            except KeyError:
-                continue
-            if source_theme_blob == target_theme_blob:
-                return target_master
-
-        return None
+        return hashlib.sha1(theme_blob).digest()
 
     @staticmethod
-    def _copy_slide_layout_part(source_layout_part, target_prs, cache):
+    def _copy_slide_layout_part(source_layout_part, target_prs, ctx):
         """Deep-copy a SlideLayoutPart into target_prs."""
-        package = target_prs.part.package
+        package = ctx.package
 
         # 1. Ensure the parent master exists in the target
         source_master_part = source_layout_part.part_related_by(RT.SLIDE_MASTER)
         target_master_part = SlideCopier._get_or_copy_slide_master(
-            source_master_part, target_prs, cache,
+            source_master_part, target_prs, ctx,
         )
 
         # 2. Deep-copy the layout XML
-        new_layout_element = deepcopy(source_layout_part._element)
+        new_layout_element = _fast_copy_element(source_layout_part._element)
 
         # 3. Create the new SlideLayoutPart
         partname = package.next_partname("/ppt/slideLayouts/slideLayout%d.xml")
@@ -277,7 +504,7 @@ class SlideCopier:
 
         # 6. Copy non-structural relationships (images, etc.) and remap rIds
         rid_mapping = SlideCopier._copy_part_rels(
-            source_layout_part, target_layout_part, package,
+            source_layout_part, target_layout_part, package, ctx.images, ctx.image_digests,
         )
         if rid_mapping:
             SlideCopier._remap_rids(new_layout_element, rid_mapping)
@@ -285,39 +512,46 @@ class SlideCopier:
         return target_layout_part
 
     @staticmethod
-    def _get_or_copy_slide_master(source_master_part, target_prs, cache):
+    def _get_or_copy_slide_master(source_master_part, target_prs, ctx, source_digest=None):
         """Return a SlideMasterPart in target_prs that mirrors source_master_part.
 
-        Uses cache to avoid duplicating masters.  When the source master's
+        Uses ctx.masters to avoid duplicating masters.  When the source master's
         theme already exists in the target presentation the existing master
-        is reused instead of creating a duplicate.
+        is reused instead of creating a duplicate.  ``source_digest`` may be
+        passed when the source theme's SHA-1 is already known.
         """
-        cache_key = id(source_master_part)
-        if cache_key in cache:
-            return cache[cache_key]
+        target_master_part = ctx.masters.get(source_master_part)
+        if target_master_part is not None:
+            return target_master_part
 
         # Check if the target already has a master with the same theme
-        matching_master = SlideCopier._find_matching_master(
-            source_master_part, target_prs,
+        if source_digest is None:
+            source_digest = SlideCopier._theme_digest(source_master_part)
+        target_digests = SlideCopier._target_theme_digests(target_prs, ctx)
+        matching_master = (
+            None if source_digest is None else target_digests.get(source_digest)
         )
         if matching_master is not None:
             target_master_part = matching_master.part
-            cache[cache_key] = target_master_part
+            ctx.masters[source_master_part] = target_master_part
             return target_master_part
 
         target_master_part = SlideCopier._copy_slide_master_part(
-            source_master_part, target_prs, cache,
+            source_master_part, target_prs, ctx,
         )
-        cache[cache_key] = target_master_part
+        ctx.masters[source_master_part] = target_master_part
+        # Later source masters sharing this theme reuse the copy
+        if source_digest is not None:
+            target_digests.setdefault(source_digest, target_master_part.slide_master)
         return target_master_part
 
     @staticmethod
-    def _copy_slide_master_part(source_master_part, target_prs, cache):
+    def _copy_slide_master_part(source_master_part, target_prs, ctx):
         """Deep-copy a SlideMasterPart into target_prs."""
-        package = target_prs.part.package
+        package = ctx.package
 
         # 1. Deep-copy the master XML
-        new_master_element = deepcopy(source_master_part._element)
+        new_master_element = _fast_copy_element(source_master_part._element)
 
         # 2. Remove sldLayoutIdLst — it will be rebuilt as layouts are copied
         existing_id_lst = new_master_element.sldLayoutIdLst
@@ -332,7 +566,7 @@ class SlideCopier:
 
         # 4. Copy theme
         SlideCopier._copy_theme_part(
-            source_master_part, target_master_part, target_prs, cache,
+            source_master_part, target_master_part, target_prs, ctx,
         )
 
         # 5. Register master in presentation's sldMasterIdLst first so
@@ -346,7 +580,7 @@ class SlideCopier:
 
         # 6. Copy non-structural relationships (images, etc.) and remap rIds
         rid_mapping = SlideCopier._copy_part_rels(
-            source_master_part, target_master_part, package,
+            source_master_part, target_master_part, package, ctx.images, ctx.image_digests,
         )
         if rid_mapping:
             SlideCopier._remap_rids(new_master_element, rid_mapping)
@@ -354,19 +588,19 @@ class SlideCopier:
         return target_master_part
 
     @staticmethod
-    def _copy_theme_part(source_master_part, target_master_part, target_prs, cache):
+    def _copy_theme_part(source_master_part, target_master_part, target_prs, ctx):
         """Copy the theme part from source master to target master."""
         try:
             source_theme_part = source_master_part.part_related_by(RT.THEME)
         except KeyError:
             return
 
-        cache_key = id(source_theme_part)
-        if cache_key in cache:
-            target_master_part.relate_to(cache[cache_key], RT.THEME)
+        cached_theme_part = ctx.themes.get(source_theme_part)
+        if cached_theme_part is not None:
+            target_master_part.relate_to(cached_theme_part, RT.THEME)
             return
 
-        package = target_prs.part.package
+        package = ctx.package
         partname = package.next_partname("/ppt/theme/theme%d.xml")
 
         # Theme parts are loaded as plain Part (blob-based) by python-pptx
@@ -383,11 +617,12 @@ class SlideCopier:
         # get_or_add_image_part.
         rid_mapping: dict[str, str] = {}
         for rId, rel in source_theme_part.rels.items():
+            reltype = rel.reltype
             if rel.is_external:
                 new_rId = target_theme_part.relate_to(
-                    rel.target_ref, rel.reltype, is_external=True,
+                    rel.target_ref, reltype, is_external=True,
                 )
-            elif rel.reltype == RT.IMAGE:
+            elif reltype == RT.IMAGE:
                 src_img = rel.target_part
                 new_partname = package.next_partname(
                     _partname_to_template(src_img.partname),
@@ -396,7 +631,7 @@ class SlideCopier:
                     new_partname, src_img.content_type,
                     package, blob=src_img.blob,
                 )
-                new_rId = target_theme_part.relate_to(new_img, rel.reltype)
+                new_rId = target_theme_part.relate_to(new_img, reltype)
             else:
                 src_target = rel.target_part
                 new_partname = package.next_partname(
@@ -406,7 +641,7 @@ class SlideCopier:
                     new_partname, src_target.content_type,
                     package, blob=src_target.blob,
                 )
-                new_rId = target_theme_part.relate_to(new_part, rel.reltype)
+                new_rId = target_theme_part.relate_to(new_part, reltype)
 
             if rId != new_rId:
                 rid_mapping[rId] = new_rId
@@ -422,65 +657,106 @@ class SlideCopier:
                 )
             target_theme_part._blob = theme_xml.encode("utf-8")
 
-        cache[cache_key] = target_theme_part
+        ctx.themes[source_theme_part] = target_theme_part
 
     # ------------------------------------------------------------------
     # Generic relationship copying & rId remapping
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _copy_part_rels(source_part, target_part, target_package):
+    def _copy_part_rels(source_part, target_part, target_package, image_cache=None, image_digests=None):
         """Copy non-structural relationships from source_part to target_part.
 
+        ``image_cache`` maps SHA-1 digests to image parts already copied into
+        the target package (see ``_get_or_add_image_rel()``).
+        ``image_digests`` is an optional ``_PartCache`` of source image part
+        -> SHA-1 digest; blobs found there are not hashed again, and new
+        digests are added to it.
+
         Returns a dict mapping old rId -> new rId so the caller can update
-        XML references.
+        XML references, or None when every rId was kept unchanged (common
+        when copying into a fresh part).
         """
-        rid_mapping = {}
+        rid_mapping = None
 
+        # A single pass in source order: rIds are then usually assigned
+        # identically in the target and need no remapping.
         for rId, rel in source_part.rels.items():
-            if rel.reltype in _STRUCTURAL_REL_TYPES:
+            reltype = rel.reltype
+            if reltype in _STRUCTURAL_REL_TYPES:
                 continue
 
             if rel.is_external:
                 new_rId = target_part.relate_to(
-                    rel.target_ref, rel.reltype, is_external=True,
+                    rel.target_ref, reltype, is_external=True,
+                )
+            elif reltype == RT.IMAGE:
+                src_img = rel.target_part
+                digest = None
+                if image_digests is not None:
+                    digest = image_digests.get(src_img)
+                    if digest is None:
+                        digest = hashlib.sha1(src_img.blob).digest()
+                        image_digests[src_img] = digest
+                new_rId = SlideCopier._get_or_add_image_rel(
+                    target_part, src_img.blob, image_cache, digest,
                 )
-            elif rel.reltype == RT.IMAGE:
-                image_blob = rel.target_part.blob
-                image_stream = BytesIO(image_blob)
-                _image_part, new_rId = target_part.get_or_add_image_part(image_stream)
             else:
                 # For other internal rels (e.g. charts, media), copy the
                 # blob as a generic Part.
                 src_target = rel.target_part
-                new_partname = target_package.next_partname(
-                    _partname_to_template(src_target.partname),
-                )
+                template = _CT_TO_TEMPLATE.get(src_target.content_type)
+                if template is None:
+                    template = _partname_to_template(src_target.partname)
+                new_partname = target_package.next_partname(template)
                 new_part = Part(
                     new_partname,
                     src_target.content_type,
                     target_package,
                     blob=src_target.blob,
                 )
-                new_rId = target_part.relate_to(new_part, rel.reltype)
+                new_rId = target_part.relate_to(new_part, reltype)
 
             if rId != new_rId:
+                if rid_mapping is None:
+                    rid_mapping = {}
                 rid_mapping[rId] = new_rId
 
         return rid_mapping
 
+    @staticmethod
+    def _get_or_add_image_rel(target_part, image_blob, image_cache=None, digest=None):
+        """Relate target_part to an image part holding image_blob and return the rId.
+
+        ``image_cache`` maps SHA-1 digests to image parts already in the
+        target package.  On a hit the part is related directly, skipping the
+        ``BytesIO`` wrapper and the package-wide search done by
+        ``get_or_add_image_part()``.  Misses are added to the cache.
+        ``digest`` may be passed when the blob's SHA-1 is already known.
+        """
+        if image_cache is None:
+            image_cache = {}
+
+        if digest is None:
+            digest = hashlib.sha1(image_blob).digest()
+        image_part = image_cache.get(digest)
+        if image_part is not None:
+            return target_part.relate_to(image_part, RT.IMAGE)
+
+        # BytesIO shares the buffer of an immutable bytes object until it is
+        # written to, and python-pptx only reads the stream, so no copy of
+        # the blob is made here.
+        image_part, rId = target_part.get_or_add_image_part(BytesIO(image_blob))
+        image_cache[digest] = image_part
+        return rId
+
     @staticmethod
     def _remap_rids(element, rid_mapping):
         """Walk an XML element tree and remap r:embed, r:link, r:id attributes."""
-        r_attrs = (
-            f"{{{_R_NS}}}embed",
-            f"{{{_R_NS}}}link",
-            f"{{{_R_NS}}}id",
-        )
-        for el in element.iter():
-            for attr in r_attrs:
+        for el in _RID_XPATH(element):
+            for attr in _R_ATTRS:
                 val = el.get(attr)
-                if val and val in rid_mapping:
+                if val in rid_mapping:
                     el.set(attr, rid_mapping[val])
 
     # ------------------------------------------------------------------
@@ -559,62 +835,19 @@ class SlideCopier:
 
     @staticmethod
     def _copy_slide_size(source_prs: Presentation, target_prs: Presentation):
-        """Copy slide dimensions from source to target presentation."""
-        try:
-            target_prs.slide_width = source_prs.slide_width
-            target_prs.slide_height = source_prs.slide_height
-        except Exception:
-            pass
-
-    @staticmethod
-    def _copy_images(source_slide: Slide, dest_slide: Slide):
-        """Copy image parts and relationships from source slide to destination slide."""
-        try:
-            source_part = source_slide.part
-            dest_part = dest_slide.part
-
-            rId_mapping = {}
-
-            for rel_id, rel in source_part.rels.items():
-                if rel.reltype == RT.IMAGE:
-                    image_part = rel.target_part
-                    image_blob = image_part.blob
-                    image_stream = BytesIO(image_blob)
-
-                    result = dest_part.get_or_add_image_part(image_stream)
+        """Copy slide dimensions from source to target presentation.
 
-                    if isinstance(result, tuple):
-                        new_image_part, new_rId = result
-                        rId_mapping[rel_id] = new_rId
-                        continue
-                    else:
-                        new_image_part = result
-
-                    for new_rel_id, new_rel in dest_part.rels.items():
-                        if (new_rel.reltype == RT.IMAGE and
-                                new_rel.target_part == new_image_part):
-                            rId_mapping[rel_id] = new_rel_id
-                            break
-
-            if rId_mapping:
-                p_ns = 'http://schemas.openxmlformats.org/presentationml/2006/main'
-                a_ns = 'http://schemas.openxmlformats.org/drawingml/2006/main'
-
-                pics = dest_slide.element.findall(f'.//{{{p_ns}}}pic')
-                for pic in pics:
-                    blips = pic.findall(f'.//{{{a_ns}}}blip')
-                    for blip in blips:
-                        embed_attr = f'{{{_R_NS}}}embed'
-                        old_rId = blip.get(embed_attr)
-
-                        if old_rId and old_rId in rId_mapping:
-                            blip.set(embed_attr, rId_mapping[old_rId])
-
-        except Exception:
-            pass
+        Nothing is copied when the source has no ``p:sldSz`` element, in
+        which case python-pptx reports both dimensions as None.
+        """
+        slide_width = source_prs.slide_width
+        slide_height = source_prs.slide_height
+        if slide_width is None or slide_height is None:
+            return
+        target_prs.slide_width = slide_width
+        target_prs.slide_height = slide_height
 
 
 def _partname_to_template(partname):
     """Convert a PackURI like '/ppt/media/image3.png' to '/ppt/media/image%d.png'."""
-    import re
-    return re.sub(r'\d+(?=\.[^.]+$)', '%d', str(partname))
+    return _PARTNAME_RE.sub('%d', str(partname))
@@ -1,31 +1,95 @@
 """Tests for SlideCopier."""
 
-import tempfile
+import base64
+import functools
+import gc
+import hashlib
+import operator
+import re
+import weakref
+from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
 
+import pptx
 import pytest
 from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
 from pptx.util import Inches, Pt
 
-from pptx_slide_copier import SlideCopier
+from pptx_slide_copier import SlideCopier, slide_copier
 
 
-@pytest.fixture
-def sample_presentation():
-    """Create a sample presentation with text and shapes."""
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
+@functools.lru_cache(maxsize=1)
+def _default_bytes():
+    """Read python-pptx's built-in template once per process instead of on every Presentation()."""
+    return (Path(pptx.__file__).parent / "templates" / "default.pptx").read_bytes()
+
+
+def _blank():
+    """Return a new presentation based on the default template."""
+    return Presentation(BytesIO(_default_bytes()))
+
+
+# EMU lengths used to lay out test shapes
+_IN1, _IN3, _IN4, _IN7_5, _IN8, _IN10 = (
+    Inches(1), Inches(3), Inches(4), Inches(7.5), Inches(8), Inches(10)
+)
+_PT24 = Pt(24)
+
+
+# 1x1 red PNG
+_RED_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAIAAACQd1PeAAAADElEQVR4nGP4z8AAAAMBAQDJ/pLvAAAAAElFTkSuQmCC"
+)
+# 1x1 blue PNG
+_BLUE_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAIAAACQd1PeAAAADElEQVR4nGNgYPgPAAEDAQAIicLsAAAAAElFTkSuQmCC"
+)
+
+
+def _different_theme_source():
+    """Create a source presentation with a modified theme blob."""
+    prs = _blank()
+    theme_part = prs.slide_masters[0].part.part_related_by(RT.THEME)
+    theme_part._blob = b"".join((theme_part._blob, b"<!-- different -->"))
+    prs.slides.add_slide(prs.slide_layouts[0])
+    return prs
+
+
+def _tf_shapes(slide):
+    """Return the shapes on *slide* that have a text frame."""
+    return filter(operator.attrgetter("has_text_frame"), slide.shapes)
+
+
+def _theme_part_sha256s(prs):
+    """Return the SHA-256 digest of every theme part in the package."""
+    return [
+        hashlib.sha256(p.blob).digest()
+        for p in prs.part.package.iter_parts()
+        if p.content_type == CT.OFC_THEME
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_pptx_bytes():
+    """Build the sample presentation with text and shapes once and return it saved as bytes."""
+    prs = _blank()
+    prs.slide_width = _IN10
+    prs.slide_height = _IN7_5
 
     # Add a slide with some text
     slide_layout = prs.slide_layouts[0]
     slide = prs.slides.add_slide(slide_layout)
 
     # Add a text box
-    left = Inches(1)
-    top = Inches(1)
-    width = Inches(8)
-    height = Inches(1)
+    left = _IN1
+    top = _IN1
+    width = _IN8
+    height = _IN1
     textbox = slide.shapes.add_textbox(left, top, width, height)
     text_frame = textbox.text_frame
     text_frame.text = "Test slide content"
@@ -34,103 +98,111 @@ def sample_presentation():
     paragraph = text_frame.paragraphs[0]
     run = paragraph.runs[0]
     run.font.name = "Arial"
-    run.font.size = Pt(24)
+    run.font.size = _PT24
     run.font.bold = True
 
-    return prs
+    buf = BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def sample_presentation(sample_pptx_bytes):
+    """Sample presentation shared by tests that only read from it."""
+    return Presentation(BytesIO(sample_pptx_bytes))
+
+
+@pytest.fixture
+def mutable_sample_presentation(sample_pptx_bytes):
+    """Fresh copy of the sample presentation for tests that modify the source."""
+    return Presentation(BytesIO(sample_pptx_bytes))
 
 
 @pytest.fixture
-def temp_pptx_file(sample_presentation):
-    """Save sample presentation to a temporary file."""
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        sample_presentation.save(tmp.name)
-        yield tmp.name
-        Path(tmp.name).unlink()
+def copied(sample_presentation):
+    """Copy slide 0 of the sample presentation into a blank target."""
+    target = _blank()
+    slide = SlideCopier.copy_slide(sample_presentation, 0, target)
+    return SimpleNamespace(slide=slide, source=sample_presentation, target=target)
 
 
 class TestSlideCopier:
     """Test cases for SlideCopier class."""
 
-    def test_copy_slide_basic(self, sample_presentation):
+    def test_copy_slide_basic(self, copied):
         """Test basic slide copying."""
-        source_prs = sample_presentation
-        target_prs = Presentation()
-
-        # Copy the first slide
-        copied_slide = SlideCopier.copy_slide(source_prs, 0, target_prs)
+        assert copied.slide is not None
+        assert len(copied.target.slides) == 1
 
-        assert copied_slide is not None
-        assert len(target_prs.slides) == 1
-
-    def test_copy_slide_preserves_text(self, sample_presentation):
+    def test_copy_slide_preserves_text(self, copied):
         """Test that text content is preserved."""
-        source_prs = sample_presentation
-        target_prs = Presentation()
-
-        copied_slide = SlideCopier.copy_slide(source_prs, 0, target_prs)
-
         # Find text in copied slide
-        found_text = False
-        for shape in copied_slide.shapes:
-            if hasattr(shape, "text") and "Test slide content" in shape.text:
-                found_text = True
-                break
+        found_text = any(
+            "Test slide content" in shape.text_frame.text for shape in _tf_shapes(copied.slide)
+        )
 
         assert found_text, "Text content should be preserved"
 
-    def test_copy_slide_preserves_size(self, sample_presentation):
+    def test_copy_slide_preserves_size(self, copied):
         """Test that slide dimensions are preserved."""
-        source_prs = sample_presentation
-        target_prs = Presentation()
+        assert copied.target.slide_width == copied.source.slide_width
+        assert copied.target.slide_height == copied.source.slide_height
+
+    def test_copy_slide_source_without_size(self, mutable_sample_presentation):
+        """Test that a source without p:sldSz leaves the target size unchanged."""
+        source_prs = mutable_sample_presentation
+        source_prs.part._element.remove(source_prs.part._element.sldSz)
+        target_prs = _blank()
+        target_width, target_height = target_prs.slide_width, target_prs.slide_height
 
         SlideCopier.copy_slide(source_prs, 0, target_prs)
 
-        assert target_prs.slide_width == source_prs.slide_width
-        assert target_prs.slide_height == source_prs.slide_height
+        assert target_prs.slide_width == target_width
+        assert target_prs.slide_height == target_height
 
     def test_copy_multiple_slides(self, sample_presentation):
         """Test copying multiple slides."""
         source_prs = sample_presentation
-        target_prs = Presentation()
+        target_prs = _blank()
 
         # Copy the same slide twice
-        SlideCopier.copy_slide(source_prs, 0, target_prs)
-        SlideCopier.copy_slide(source_prs, 0, target_prs)
+        slides = SlideCopier.copy_slides(source_prs, target_prs, slide_indices=[0, 0])
 
+        assert len(slides) == 2
         assert len(target_prs.slides) == 2
 
-    def test_copy_slide_with_formatting(self, sample_presentation):
+    def test_copy_slide_with_formatting(self, copied):
         """Test that text formatting is preserved."""
-        source_prs = sample_presentation
-        target_prs = Presentation()
-
-        copied_slide = SlideCopier.copy_slide(source_prs, 0, target_prs)
-
-        # Check that formatting is preserved
-        for shape in copied_slide.shapes:
-            if hasattr(shape, "text_frame"):
-                for paragraph in shape.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        if run.text == "Test slide content":
-                            # Font properties should be preserved
-                            assert run.font.bold
-                            # Font name and size should be set
-                            assert run.font.name is not None
-                            assert run.font.size is not None
-
-    def test_copy_slide_to_template_based_presentation(self, temp_pptx_file):
+        # Check that formatting is preserved on the first matching run
+        run = next(
+            (
+                r
+                for s in _tf_shapes(copied.slide)
+                for p in s.text_frame.paragraphs
+                for r in p.runs
+                if r.text == "Test slide content"
+            ),
+            None,
+        )
+        assert run is not None, "Formatted run should be copied"
+        # Font properties should be preserved
+        assert run.font.bold
+        # Font name and size should be set
+        assert run.font.name is not None
+        assert run.font.size is not None
+
+    def test_copy_slide_to_template_based_presentation(self, sample_pptx_bytes):
         """Test copying to a presentation based on the same template."""
-        source_prs = Presentation(temp_pptx_file)
+        source_prs = Presentation(BytesIO(sample_pptx_bytes))
 
         # Create target from same template
-        target_prs = Presentation(temp_pptx_file)
+        target_prs = Presentation(BytesIO(sample_pptx_bytes))
 
         # Remove all slides from target
-        while len(target_prs.slides) > 0:
-            rId = target_prs.slides._sldIdLst[0].rId
-            target_prs.part.drop_rel(rId)
-            del target_prs.slides._sldIdLst[0]
+        sldIdLst = target_prs.slides._sldIdLst
+        for sldId in list(sldIdLst):
+            target_prs.part.drop_rel(sldId.rId)
+        sldIdLst.clear()
 
         assert len(target_prs.slides) == 0
 
@@ -142,20 +214,48 @@ class TestSlideCopier:
     def test_copy_slide_invalid_index(self, sample_presentation):
         """Test that invalid slide index raises appropriate error."""
         source_prs = sample_presentation
-        target_prs = Presentation()
+        target_prs = _blank()
 
         with pytest.raises(IndexError):
             SlideCopier.copy_slide(source_prs, 999, target_prs)
 
-    def test_copy_slide_preserves_shapes(self, sample_presentation):
+    def test_copy_slide_preserves_shapes(self, copied):
         """Test that shapes are copied."""
-        source_prs = sample_presentation
+        # Should have same number of shapes (or close, due to layout elements)
+        assert len(copied.slide.shapes) > 0
+
+    def test_copy_slide_preserves_shape_order(self):
+        """Test that shapes keep their z-order on the copied slide."""
+        source_prs = _blank()
+        slide = source_prs.slides.add_slide(source_prs.slide_layouts[6])
+        for text in ("first", "second", "third"):
+            slide.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = text
 
-        target_prs = Presentation()
+        target_prs = _blank()
         copied_slide = SlideCopier.copy_slide(source_prs, 0, target_prs)
 
-        # Should have same number of shapes (or close, due to layout elements)
-        assert len(copied_slide.shapes) > 0
+        assert [shape.text_frame.text for shape in copied_slide.shapes] == ["first", "second", "third"]
+
+    def test_copy_slide_shapes_have_no_namespace_declarations(self, sample_presentation):
+        """Test that copied shapes rely on the slide's namespace declarations instead of redeclaring them."""
+        from lxml import etree
+
+        target_prs = _blank()
+        copied_slide = SlideCopier.copy_slide(sample_presentation, 0, target_prs)
+
+        xml = etree.tostring(copied_slide.element)
+        below_root = xml[xml.index(b">"):]
+        assert b"xmlns" not in below_root
+
+    def test_copy_slide_shapes_are_independent(self, mutable_sample_presentation):
+        """Test that editing a copied shape does not modify the source shape."""
+        source_prs = mutable_sample_presentation
+        target_prs = _blank()
+
+        copied_slide = SlideCopier.copy_slide(source_prs, 0, target_prs)
+        copied_slide.shapes[-1].text_frame.text = "changed"
+
+        assert source_prs.slides[0].shapes[-1].text_frame.text == "Test slide content"
 
 
 class TestLayoutPreservation:
@@ -164,22 +264,30 @@ class TestLayoutPreservation:
     @staticmethod
     def _make_source_with_custom_layout():
         """Create a source presentation whose layout name differs from the default template."""
-        prs = Presentation()
+        prs = _blank()
         # The built-in default template has layouts like "Title Slide", "Title and Content", etc.
         # We'll use the first layout and record its name for later assertion.
         layout = prs.slide_layouts[0]
         slide = prs.slides.add_slide(layout)
-        textbox = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+        textbox = slide.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1)
         textbox.text_frame.text = "hello"
         return prs
 
-    def test_layout_name_preserved_across_different_templates(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def custom_layout_bytes(cls):
+        """Build the custom-layout source once per class and return it saved as bytes."""
+        buf = BytesIO()
+        cls._make_source_with_custom_layout().save(buf)
+        return buf.getvalue()
+
+    def test_layout_name_preserved_across_different_templates(self, custom_layout_bytes):
         """Copying between presentations with different templates preserves layout name."""
-        source_prs = self._make_source_with_custom_layout()
+        source_prs = Presentation(BytesIO(custom_layout_bytes))
         source_layout_name = source_prs.slides[0].slide_layout.name
 
         # Target starts as a blank presentation (its own default template)
-        target_prs = Presentation()
+        target_prs = _blank()
 
         SlideCopier.copy_slide(source_prs, 0, target_prs)
 
@@ -188,44 +296,52 @@ class TestLayoutPreservation:
 
     def test_no_duplicate_parts_for_same_layout(self):
         """Copying two slides sharing the same layout should not duplicate master/layout parts."""
-        source_prs = Presentation()
+        source_prs = _blank()
         layout = source_prs.slide_layouts[0]
         source_prs.slides.add_slide(layout)
         source_prs.slides.add_slide(layout)
 
-        target_prs = Presentation()
+        target_prs = _blank()
         slides = SlideCopier.copy_slides(source_prs, target_prs, slide_indices=[0, 1])
 
         assert len(slides) == 2
         # Both copied slides must reference the same layout part
         assert slides[0].slide_layout.part is slides[1].slide_layout.part
 
-    def test_layout_survives_save_and_reload(self):
+    def test_copied_layout_is_reachable_from_package(self, custom_layout_bytes):
+        """The copied slide's layout hangs off a target master, so saving will include it."""
+        source_prs = Presentation(BytesIO(custom_layout_bytes))
+
+        target_prs = _blank()
+        copied_slide = SlideCopier.copy_slide(source_prs, 0, target_prs)
+
+        layout = copied_slide.slide_layout
+        assert layout.slide_master in list(target_prs.slide_masters)
+        assert layout in list(layout.slide_master.slide_layouts)
+        assert layout.part in set(target_prs.part.package.iter_parts())
+
+    def test_layout_survives_save_and_reload(self, custom_layout_bytes):
         """Layout name is still correct after saving and reloading the file."""
-        source_prs = self._make_source_with_custom_layout()
+        source_prs = Presentation(BytesIO(custom_layout_bytes))
         source_layout_name = source_prs.slides[0].slide_layout.name
 
-        target_prs = Presentation()
+        target_prs = _blank()
         SlideCopier.copy_slide(source_prs, 0, target_prs)
 
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-            target_prs.save(tmp.name)
-            tmp_path = tmp.name
-
-        try:
-            reloaded = Presentation(tmp_path)
-            assert len(reloaded.slides) == 1
-            assert reloaded.slides[0].slide_layout.name == source_layout_name
-        finally:
-            Path(tmp_path).unlink()
+        buf = BytesIO()
+        target_prs.save(buf)
+        buf.seek(0)
+        reloaded = Presentation(buf)
+        assert len(reloaded.slides) == 1
+        assert reloaded.slides[0].slide_layout.name == source_layout_name
 
     def test_copy_slides_convenience_method(self):
         """copy_slides copies all slides when slide_indices is None."""
-        source_prs = Presentation()
+        source_prs = _blank()
         source_prs.slides.add_slide(source_prs.slide_layouts[0])
         source_prs.slides.add_slide(source_prs.slide_layouts[1])
 
-        target_prs = Presentation()
+        target_prs = _blank()
         slides = SlideCopier.copy_slides(source_prs, target_prs)
 
         assert len(slides) == 2
@@ -233,13 +349,13 @@ class TestLayoutPreservation:
 
     def test_copy_layouts_then_slides(self):
         """copy_layouts() followed by copy_slide() with layout_map works correctly."""
-        source_prs = Presentation()
+        source_prs = _blank()
         layout_0 = source_prs.slide_layouts[0]
         layout_1 = source_prs.slide_layouts[1]
         source_prs.slides.add_slide(layout_0)
         source_prs.slides.add_slide(layout_1)
 
-        target_prs = Presentation()
+        target_prs = _blank()
         layout_map = SlideCopier.copy_layouts(source_prs, target_prs)
 
         # All source layout names should be in the map
@@ -257,73 +373,71 @@ class TestLayoutPreservation:
 
     def test_target_has_two_themes(self):
         """After copy_layouts with different themes, target should have original + source theme."""
-        from pptx.opc.constants import CONTENT_TYPE as CT
-        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-
-        def _count_theme_parts(prs):
-            parts = set()
-            for rel in prs.part.package.iter_rels():
-                try:
-                    if rel.target_part.content_type == CT.OFC_THEME:
-                        parts.add(rel.target_part.partname)
-                except Exception:
-                    pass
-            return len(parts)
-
-        source_prs = Presentation()
+        source_prs = _blank()
         source_prs.slides.add_slide(source_prs.slide_layouts[0])
 
         # ソースのテーマ blob を変更して異なるテーマにする
         source_theme_part = source_prs.slide_masters[0].part.part_related_by(RT.THEME)
-        source_theme_part._blob = source_theme_part.blob + b"<!-- modified -->"
+        source_theme_part._blob = b"".join((source_theme_part._blob, b"<!-- modified -->"))
 
-        target_prs = Presentation()
-        original_theme_count = _count_theme_parts(target_prs)
+        target_prs = _blank()
+        original_theme_count = len(_theme_part_sha256s(target_prs))
 
         SlideCopier.copy_layouts(source_prs, target_prs)
 
-        total_theme_count = _count_theme_parts(target_prs)
+        digests = _theme_part_sha256s(target_prs)
+        total_theme_count = len(digests)
+        # No two theme parts may carry the same content
+        assert len(set(digests)) == total_theme_count
         assert total_theme_count == original_theme_count + 1
 
     def test_same_theme_no_duplicate(self):
         """同じテーマを持つソースとターゲットでcopy_layouts後にテーマ数が増えないこと。"""
-        from pptx.opc.constants import CONTENT_TYPE as CT
-
-        def _count_theme_parts(prs):
-            parts = set()
-            for rel in prs.part.package.iter_rels():
-                try:
-                    if rel.target_part.content_type == CT.OFC_THEME:
-                        parts.add(rel.target_part.partname)
-                except Exception:
-                    pass
-            return len(parts)
-
         # 同じデフォルトテンプレートから作成
-        source_prs = Presentation()
+        source_prs = _blank()
         source_prs.slides.add_slide(source_prs.slide_layouts[0])
 
-        target_prs = Presentation()
-        original_theme_count = _count_theme_parts(target_prs)
+        target_prs = _blank()
+        original_theme_count = len(_theme_part_sha256s(target_prs))
 
         SlideCopier.copy_layouts(source_prs, target_prs)
 
-        total_theme_count = _count_theme_parts(target_prs)
+        digests = _theme_part_sha256s(target_prs)
+        total_theme_count = len(digests)
+        # No two theme parts may carry the same content
+        assert len(set(digests)) == total_theme_count
         assert total_theme_count == original_theme_count
 
+    def test_copy_layouts_hashes_each_theme_once(self, monkeypatch):
+        """copy_layouts hashes the source and target themes once each."""
+        source_prs = _different_theme_source()
+        target_prs = _blank()
+
+        hashed = []
+        theme_digest = SlideCopier._theme_digest
+
+        def counting_theme_digest(master_part):
+            hashed.append(master_part)
+            return theme_digest(master_part)
+
+        monkeypatch.setattr(SlideCopier, "_theme_digest", staticmethod(counting_theme_digest))
+        SlideCopier.copy_layouts(source_prs, target_prs)
+
+        assert len(hashed) == 2
+
     def test_copy_slide_target_index_insert_at_beginning(self):
         """target_slide_index=0 inserts the copied slide at the beginning."""
-        target_prs = Presentation()
+        target_prs = _blank()
         layout = target_prs.slide_layouts[0]
         # Add two existing slides with identifiable text
         s1 = target_prs.slides.add_slide(layout)
-        s1.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "existing-1"
+        s1.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "existing-1"
         s2 = target_prs.slides.add_slide(layout)
-        s2.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "existing-2"
+        s2.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "existing-2"
 
-        source_prs = Presentation()
+        source_prs = _blank()
         src_slide = source_prs.slides.add_slide(source_prs.slide_layouts[0])
-        src_slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "copied"
+        src_slide.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "copied"
 
         SlideCopier.copy_slide(source_prs, 0, target_prs, target_slide_index=0)
 
@@ -332,23 +446,23 @@ class TestLayoutPreservation:
         texts = []
         for slide in target_prs.slides:
             for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text:
-                    texts.append(shape.text)
+                if shape.has_text_frame and shape.text_frame.text:
+                    texts.append(shape.text_frame.text)
                     break
         assert texts == ["copied", "existing-1", "existing-2"]
 
     def test_copy_slide_target_index_insert_in_middle(self):
         """target_slide_index=1 inserts the copied slide at position 1."""
-        target_prs = Presentation()
+        target_prs = _blank()
         layout = target_prs.slide_layouts[0]
         s1 = target_prs.slides.add_slide(layout)
-        s1.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "existing-1"
+        s1.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "existing-1"
         s2 = target_prs.slides.add_slide(layout)
-        s2.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "existing-2"
+        s2.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "existing-2"
 
-        source_prs = Presentation()
+        source_prs = _blank()
         src_slide = source_prs.slides.add_slide(source_prs.slide_layouts[0])
-        src_slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "copied"
+        src_slide.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "copied"
 
         SlideCopier.copy_slide(source_prs, 0, target_prs, target_slide_index=1)
 
@@ -356,21 +470,21 @@ class TestLayoutPreservation:
         texts = []
         for slide in target_prs.slides:
             for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text:
-                    texts.append(shape.text)
+                if shape.has_text_frame and shape.text_frame.text:
+                    texts.append(shape.text_frame.text)
                     break
         assert texts == ["existing-1", "copied", "existing-2"]
 
     def test_copy_slide_target_index_none_appends(self):
         """target_slide_index=None (default) appends at the end."""
-        target_prs = Presentation()
+        target_prs = _blank()
         layout = target_prs.slide_layouts[0]
         s1 = target_prs.slides.add_slide(layout)
-        s1.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "existing-1"
+        s1.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "existing-1"
 
-        source_prs = Presentation()
+        source_prs = _blank()
         src_slide = source_prs.slides.add_slide(source_prs.slide_layouts[0])
-        src_slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "copied"
+        src_slide.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "copied"
 
         SlideCopier.copy_slide(source_prs, 0, target_prs)
 
@@ -378,25 +492,26 @@ class TestLayoutPreservation:
         texts = []
         for slide in target_prs.slides:
             for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text:
-                    texts.append(shape.text)
+                if shape.has_text_frame and shape.text_frame.text:
+                    texts.append(shape.text_frame.text)
                     break
         assert texts == ["existing-1", "copied"]
 
     def test_copy_slides_target_index(self):
         """copy_slides with target_slide_index inserts slides sequentially."""
-        target_prs = Presentation()
+        target_prs = _blank()
         layout = target_prs.slide_layouts[0]
         s1 = target_prs.slides.add_slide(layout)
-        s1.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "existing-1"
+        s1.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "existing-1"
         s2 = target_prs.slides.add_slide(layout)
-        s2.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "existing-2"
+        s2.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "existing-2"
 
-        source_prs = Presentation()
-        src1 = source_prs.slides.add_slide(source_prs.slide_layouts[0])
-        src1.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "copied-A"
-        src2 = source_prs.slides.add_slide(source_prs.slide_layouts[0])
-        src2.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "copied-B"
+        source_prs = _blank()
+        source_layout = source_prs.slide_layouts[0]
+        src1 = source_prs.slides.add_slide(source_layout)
+        src1.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "copied-A"
+        src2 = source_prs.slides.add_slide(source_layout)
+        src2.shapes.add_textbox(_IN1, _IN1, _IN4, _IN1).text_frame.text = "copied-B"
 
         SlideCopier.copy_slides(source_prs, target_prs, target_slide_index=1)
 
@@ -404,47 +519,38 @@ class TestLayoutPreservation:
         texts = []
         for slide in target_prs.slides:
             for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text:
-                    texts.append(shape.text)
+                if shape.has_text_frame and shape.text_frame.text:
+                    texts.append(shape.text_frame.text)
                     break
         assert texts == ["existing-1", "copied-A", "copied-B", "existing-2"]
 
     def test_same_theme_layout_map_uses_existing(self):
         """テーマ同一時、layout_mapの値がターゲットの既存レイアウトを指すこと。"""
-        source_prs = Presentation()
+        source_prs = _blank()
         source_prs.slides.add_slide(source_prs.slide_layouts[0])
 
-        target_prs = Presentation()
+        target_prs = _blank()
         # ターゲットの既存レイアウトを記録
-        existing_layouts = {sl.name: sl for master in target_prs.slide_masters
-                           for sl in master.slide_layouts}
+        existing_layouts = {
+            sl.name: sl.part for master in target_prs.slide_masters for sl in master.slide_layouts
+        }
 
         layout_map = SlideCopier.copy_layouts(source_prs, target_prs)
 
         # layout_mapの各値がターゲットの既存レイアウトと同一であること
-        for name, layout in layout_map.items():
-            if name in existing_layouts:
-                assert layout is existing_layouts[name]
+        shared_names = existing_layouts.keys() & layout_map.keys()
+        assert shared_names
+        for name in shared_names:
+            assert layout_map[name].part is existing_layouts[name]
 
 
 class TestMasterLayoutIdAttributes:
     """Test that copied sldMasterId and sldLayoutId elements have valid id attributes."""
 
-    @staticmethod
-    def _make_different_theme_source():
-        """Create a source presentation with a modified theme blob."""
-        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-
-        prs = Presentation()
-        theme_part = prs.slide_masters[0].part.part_related_by(RT.THEME)
-        theme_part._blob = theme_part.blob + b"<!-- different -->"
-        prs.slides.add_slide(prs.slide_layouts[0])
-        return prs
-
     def test_copy_slide_different_theme_has_master_id(self):
         """sldMasterId elements must have an id attribute after copy with different theme."""
-        source_prs = self._make_different_theme_source()
-        target_prs = Presentation()
+        source_prs = _different_theme_source()
+        target_prs = _blank()
 
         SlideCopier.copy_slide(source_prs, 0, target_prs)
 
@@ -454,8 +560,8 @@ class TestMasterLayoutIdAttributes:
 
     def test_copy_slide_different_theme_has_layout_id(self):
         """sldLayoutId elements must have an id attribute after copy with different theme."""
-        source_prs = self._make_different_theme_source()
-        target_prs = Presentation()
+        source_prs = _different_theme_source()
+        target_prs = _blank()
 
         SlideCopier.copy_slide(source_prs, 0, target_prs)
 
@@ -467,8 +573,8 @@ class TestMasterLayoutIdAttributes:
 
     def test_copy_slides_different_theme_has_master_id(self):
         """sldMasterId elements must have an id attribute after copy_slides with different theme."""
-        source_prs = self._make_different_theme_source()
-        target_prs = Presentation()
+        source_prs = _different_theme_source()
+        target_prs = _blank()
 
         SlideCopier.copy_slides(source_prs, target_prs)
 
@@ -478,8 +584,8 @@ class TestMasterLayoutIdAttributes:
 
     def test_ids_are_unique(self):
         """All sldMasterId and sldLayoutId id values must be unique across the presentation."""
-        source_prs = self._make_different_theme_source()
-        target_prs = Presentation()
+        source_prs = _different_theme_source()
+        target_prs = _blank()
 
         SlideCopier.copy_slide(source_prs, 0, target_prs)
 
@@ -503,10 +609,11 @@ class TestMasterLayoutIdAttributes:
 
     def test_copy_slide_different_theme_with_target_index_has_ids(self):
         """File must not be corrupted when using target_slide_index with different theme."""
-        source_prs = self._make_different_theme_source()
-        target_prs = Presentation()
-        target_prs.slides.add_slide(target_prs.slide_layouts[0])
-        target_prs.slides.add_slide(target_prs.slide_layouts[0])
+        source_prs = _different_theme_source()
+        target_prs = _blank()
+        layout = target_prs.slide_layouts[0]
+        target_prs.slides.add_slide(layout)
+        target_prs.slides.add_slide(layout)
 
         SlideCopier.copy_slide(source_prs, 0, target_prs, target_slide_index=1)
 
@@ -515,12 +622,220 @@ class TestMasterLayoutIdAttributes:
             assert entry.get("id") is not None, "sldMasterId missing id attribute"
 
         # Verify file can be saved and reloaded
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-            target_prs.save(tmp.name)
-            tmp_path = tmp.name
-
-        try:
-            reloaded = Presentation(tmp_path)
-            assert len(reloaded.slides) == 3
-        finally:
-            Path(tmp_path).unlink()
+        buf = BytesIO()
+        target_prs.save(buf)
+        buf.seek(0)
+        reloaded = Presentation(buf)
+        assert len(reloaded.slides) == 3
+
+
+class TestCopyCache:
+    """Test when parts copied into a target are reused by later calls."""
+
+    def test_repeated_copy_slides_copies_layouts_once(self):
+        """A second copy_slides call into the same target reuses the copied master and layouts."""
+        source_prs = _different_theme_source()
+        target_prs = _blank()
+
+        first = SlideCopier.copy_slides(source_prs, target_prs)
+        layout_counts = [len(master.slide_layouts) for master in target_prs.slide_masters]
+        second = SlideCopier.copy_slides(source_prs, target_prs)
+
+        assert [len(master.slide_layouts) for master in target_prs.slide_masters] == layout_counts
+        assert first[0].slide_layout.part is second[0].slide_layout.part
+
+    def test_repeated_copy_slide_copies_layout_once(self):
+        """Calling copy_slide repeatedly without a layout_map copies the layout only once."""
+        source_prs = _different_theme_source()
+        target_prs = _blank()
+
+        slides = [SlideCopier.copy_slide(source_prs, 0, target_prs) for _ in range(3)]
+
+        assert len({slide.slide_layout.part for slide in slides}) == 1
+        assert len(target_prs.slide_masters) == 2
+        assert len(target_prs.slide_masters[1].slide_layouts) == 1
+
+    def test_invalidate_cache_copies_layout_again(self):
+        """After invalidate_cache, copy_slide copies the layout anew."""
+        source_prs = _different_theme_source()
+        target_prs = _blank()
+
+        first = SlideCopier.copy_slide(source_prs, 0, target_prs)
+        SlideCopier.invalidate_cache(target_prs)
+        second = SlideCopier.copy_slide(source_prs, 0, target_prs)
+
+        assert first.slide_layout.part is not second.slide_layout.part
+
+    def test_copy_slides_picks_up_source_edits(self):
+        """Edits to the source between copy_slides calls are copied without invalidate_cache."""
+        source_prs = _different_theme_source()
+        target_prs = _blank()
+
+        SlideCopier.copy_slides(source_prs, target_prs)
+        theme_part = source_prs.slide_masters[0].part.part_related_by(RT.THEME)
+        theme_part._blob = b"".join((theme_part._blob, b"<!-- edited -->"))
+        second = SlideCopier.copy_slides(source_prs, target_prs)
+
+        copied_theme = second[0].slide_layout.slide_master.part.part_related_by(RT.THEME)
+        assert copied_theme.blob == theme_part.blob
+
+    def test_deprecated_cache_argument_shares_copies(self):
+        """copy_slides calls given the same cache dict warn and reuse the copied theme."""
+        source_prs = _different_theme_source()
+        target_prs = _blank()
+        cache = {}
+
+        with pytest.warns(DeprecationWarning, match="cache"):
+            first = SlideCopier.copy_slides(source_prs, target_prs, cache=cache)
+        theme_part = source_prs.slide_masters[0].part.part_related_by(RT.THEME)
+        theme_part._blob = b"".join((theme_part._blob, b"<!-- edited -->"))
+        with pytest.warns(DeprecationWarning, match="cache"):
+            second = SlideCopier.copy_slides(source_prs, target_prs, cache=cache)
+
+        assert first[0].slide_layout.part is second[0].slide_layout.part
+        copied_theme = second[0].slide_layout.slide_master.part.part_related_by(RT.THEME)
+        assert copied_theme.blob != theme_part.blob
+
+    def test_copy_slide_sees_edited_target_theme(self):
+        """A target master whose theme was edited since an earlier copy_slide is no longer matched."""
+        target_prs = _blank()
+        for edit_target in (False, True):
+            source_prs = _blank()
+            source_prs.slides.add_slide(source_prs.slide_layouts[0])
+            if edit_target:
+                theme_part = target_prs.slide_masters[0].part.part_related_by(RT.THEME)
+                theme_part._blob = b"".join((theme_part._blob, b"<!-- edited -->"))
+            copied_slide = SlideCopier.copy_slide(source_prs, 0, target_prs)
+
+        assert len(target_prs.slide_masters) == 2
+        assert copied_slide.slide_layout.slide_master.part is target_prs.slide_masters[1].part
+
+    def test_copy_does_not_keep_source_alive(self):
+        """The cache kept on the target does not keep a copied source presentation alive."""
+        source_prs = _different_theme_source()
+        source_package = weakref.ref(source_prs.part.package)
+        target_prs = _blank()
+
+        SlideCopier.copy_slides(source_prs, target_prs)
+        SlideCopier.copy_slide(source_prs, 0, target_prs)
+        del source_prs
+        gc.collect()
+
+        assert source_package() is None
+        assert len(target_prs.slides) == 2
+
+
+class TestRelationshipRemapping:
+    """Test that relationship ids in copied XML are remapped correctly."""
+
+    def test_remap_rids_rewrites_nested_attributes(self):
+        """r:embed, r:link and r:id attributes are remapped at any depth."""
+        from pptx.oxml import parse_xml
+
+        element = parse_xml(
+            '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+            ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<p:pic><p:blipFill><a:blip r:embed="rId2" r:link="rId3"/></p:blipFill></p:pic>'
+            '<a:hlinkClick r:id="rId4"/>'
+            '</p:spTree>'
+        )
+
+        SlideCopier._remap_rids(element, {"rId2": "rId7", "rId4": "rId9"})
+
+        r_ns = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+        blip = element[0][0][0]
+        assert blip.get(f"{r_ns}embed") == "rId7"
+        assert blip.get(f"{r_ns}link") == "rId3"
+        assert element[1].get(f"{r_ns}id") == "rId9"
+
+    def test_remap_rids_is_scoped_to_subtree(self):
+        """Only the given element and its descendants are remapped."""
+        from pptx.oxml import parse_xml
+
+        root = parse_xml(
+            '<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+            ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<p:cSld r:id="rId2"/><p:clrMapOvr r:id="rId2"/>'
+            '</p:sld>'
+        )
+
+        SlideCopier._remap_rids(root[0], {"rId2": "rId5"})
+
+        r_id = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+        assert root[0].get(r_id) == "rId5"
+        assert root[1].get(r_id) == "rId2"
+
+    def test_copy_slide_preserves_picture(self):
+        """A copied picture still references the same image data."""
+        source_prs = _blank()
+        slide = source_prs.slides.add_slide(source_prs.slide_layouts[6])
+        slide.shapes.add_picture(BytesIO(_RED_PNG), _IN1, _IN1)
+
+        target_prs = _blank()
+        copied_slide = SlideCopier.copy_slide(source_prs, 0, target_prs)
+
+        pictures = [shape for shape in copied_slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE]
+        assert len(pictures) == 1
+        assert pictures[0].image.blob == _RED_PNG
+
+    def test_copy_slides_reuses_image_part(self):
+        """A picture shown on several slides is stored once in the target."""
+        source_prs = _blank()
+        layout = source_prs.slide_layouts[6]
+        for _ in range(3):
+            slide = source_prs.slides.add_slide(layout)
+            slide.shapes.add_picture(BytesIO(_RED_PNG), _IN1, _IN1)
+
+        target_prs = _blank()
+        slides = SlideCopier.copy_slides(source_prs, target_prs)
+
+        image_parts = {slide.part.related_part(slide.shapes[0]._element.blip_rId) for slide in slides}
+        assert len(image_parts) == 1
+
+    def test_copy_slides_hashes_each_source_image_once(self, monkeypatch):
+        """Each source image part is hashed once, however many slides show it."""
+        source_prs = _blank()
+        layout = source_prs.slide_layouts[6]
+        for png in (_RED_PNG, _BLUE_PNG, _RED_PNG):
+            slide = source_prs.slides.add_slide(layout)
+            slide.shapes.add_picture(BytesIO(png), _IN1, _IN1)
+        target_prs = _blank()
+
+        hashed = []
+
+        def counting_sha1(data):
+            hashed.append(bytes(data))
+            return hashlib.sha1(data)
+
+        monkeypatch.setattr(slide_copier, "hashlib", SimpleNamespace(sha1=counting_sha1))
+        SlideCopier.copy_slides(source_prs, target_prs)
+
+        assert hashed.count(_RED_PNG) == 1
+        assert hashed.count(_BLUE_PNG) == 1
+
+    def test_copy_slide_copies_chart_part(self):
+        """A chart on the slide is copied to a new part under /ppt/charts/."""
+        from pptx.chart.data import CategoryChartData
+        from pptx.enum.chart import XL_CHART_TYPE
+
+        source_prs = _blank()
+        slide = source_prs.slides.add_slide(source_prs.slide_layouts[6])
+        chart_data = CategoryChartData()
+        chart_data.categories = ["a", "b"]
+        chart_data.add_series("s", (1, 2))
+        graphic_frame = slide.shapes.add_chart(
+            XL_CHART_TYPE.COLUMN_CLUSTERED, _IN1, _IN1, _IN4, _IN3, chart_data,
+        )
+        # A partname that does not follow PowerPoint's naming, so the copy's
+        # name can only come from the content type
+        source_chart_part = slide.part.related_part(graphic_frame._element.chart_rId)
+        source_chart_part.partname = PackURI("/ppt/charts/foo7.xml")
+
+        target_prs = _blank()
+        copied_slide = SlideCopier.copy_slide(source_prs, 0, target_prs)
+
+        rId = copied_slide.shapes[0]._element.chart_rId
+        chart_part = copied_slide.part.related_part(rId)
+        assert chart_part is not source_chart_part
+        assert re.fullmatch(r"/ppt/charts/chart\d+\.xml", chart_part.partname)